@@ -13,10 +13,17 @@ This simulator intentionally ignores grid movement/terrain geometry, but models:
 
 from __future__ import annotations
 
-from collections import Counter, defaultdict
+from collections import Counter
 from dataclasses import dataclass, field
+from functools import lru_cache
+import gc
+import heapq
+from itertools import product
+import multiprocessing
+from operator import attrgetter, itemgetter
+import os
 import random
-import statistics
+import sys
 from typing import Dict, List, Optional, Tuple
 
 CP_DAMAGE = 1.0
@@ -45,8 +52,55 @@ OPPOSING = {
     "breached": "armored",
 }
 
+# conditions are stored as an int bitmask on HeroState/Enemy, one bit per name
+COND_BITS = {name: 1 << i for i, name in enumerate(sorted(POSITIVE_CONDS | NEGATIVE_CONDS))}
+COND_EMPOWERED = COND_BITS["empowered"]
+COND_EXALTED = COND_BITS["exalted"]
+COND_WEAKENED = COND_BITS["weakened"]
+COND_ENFEEBLED = COND_BITS["enfeebled"]
+COND_EXPOSED = COND_BITS["exposed"]
+COND_BREACHED = COND_BITS["breached"]
+COND_BLEEDING = COND_BITS["bleeding"]
+COND_HEMORRHAGING = COND_BITS["hemorrhaging"]
+COND_SLOWED = COND_BITS["slowed"]
+COND_STAGGERED = COND_BITS["staggered"]
+POSITIVE_MASK = sum(COND_BITS[c] for c in POSITIVE_CONDS)
+NEGATIVE_MASK = sum(COND_BITS[c] for c in NEGATIVE_CONDS)
+
+
+def _cond_delta_table(deltas: Dict[int, int]) -> Tuple[int, Dict[int, int]]:
+    """(mask of the given bits, summed delta for every combination of them)."""
+    table = {0: 0}
+    for bit, delta in deltas.items():
+        table.update([(k | bit, v + delta) for k, v in table.items()])
+    return sum(deltas), table
+
+
+# flat damage change from a hero's own conditions, looked up by conditions & mask
+HERO_DMG_COND_MASK, HERO_DMG_COND_DELTA = _cond_delta_table({COND_EMPOWERED: 1, COND_EXALTED: 3, COND_WEAKENED: -1, COND_ENFEEBLED: -3})
+# enemy attacks: penalties floor at 0 before the attacker's and target's bonuses apply
+ENEMY_DMG_PENALTY_MASK, ENEMY_DMG_PENALTY = _cond_delta_table({COND_WEAKENED: 1, COND_ENFEEBLED: 3})
+ENEMY_DMG_BONUS_MASK, ENEMY_DMG_BONUS = _cond_delta_table({COND_EMPOWERED: 1, COND_EXALTED: 3})
+TARGET_DMG_BONUS_MASK, TARGET_DMG_BONUS = _cond_delta_table({COND_EXPOSED: 1, COND_BREACHED: 3})
+
+
+def _condition_rule(incoming: str) -> Tuple[int, int, int, int]:
+    """(opposing bit, bits cleared by opposition, ladder weak bit, ladder strong bit)."""
+    opp = OPPOSING.get(incoming)
+    opp_bit = COND_BITS[opp] if opp else 0
+    opp_clear = opp_bit | (COND_BITS[CONDITION_LADDERS.get(opp, [opp])[0]] if opp else 0)
+    if incoming in CONDITION_LADDERS:
+        weak, strong = CONDITION_LADDERS[incoming]
+        return opp_bit, opp_clear, COND_BITS[weak], COND_BITS[strong]
+    return opp_bit, opp_clear, COND_BITS[incoming], 0
+
+
+# keyed by condition bit, so callers never hash condition names on the hot path
+CONDITION_RULES = {bit: _condition_rule(name) for name, bit in COND_BITS.items()}
 
-@dataclass
+
+# identity-hashed so attacks can key the dice pool cache
+@dataclass(slots=True, frozen=True, eq=False)
 class Attack:
     name: str
     base_dice: Dict[str, int]
@@ -55,32 +109,104 @@ class Attack:
     full_spender: bool = False
     range_type: str = "melee"
     special_rules: Dict[str, int] = field(default_factory=dict)
-
-
-@dataclass
+    # full spenders only: this color rolls one extra die per LP spent beyond 3
+    lp_scaled_color: Optional[str] = None
+    # frozen (color, count) views of the dicts above for the attack hot path
+    dice_pairs: Tuple[Tuple[str, int], ...] = field(init=False, repr=False)
+    special_pairs: Tuple[Tuple[str, int], ...] = field(init=False, repr=False)
+    # color with the most base dice; matched against enemy vulnerability
+    damage_type: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        dice_pairs = tuple(self.base_dice.items())
+        object.__setattr__(self, "dice_pairs", dice_pairs)
+        object.__setattr__(self, "special_pairs", tuple(self.special_rules.items()))
+        object.__setattr__(self, "damage_type", max(dice_pairs, key=lambda kv: kv[1])[0] if dice_pairs else "red")
+
+
+@dataclass(slots=True, frozen=True)
 class HeroTemplate:
     name: str
     max_hp: int
     relic_die_color: str
     attacks: List[Attack]
+    # banks specials into rune slots before seals (Merlin)
+    rune_caster: bool = False
+    # pick_attack()'s fallback between the two basic attacks never changes
+    basic_attack: Attack = field(init=False, repr=False)
 
+    def __post_init__(self):
+        b1, b2 = self.attacks[0], self.attacks[1]
+        basic = b1 if (sum(b1.base_dice.values()) + 0.6 * b1.lp_gain) >= (sum(b2.base_dice.values()) + 0.6 * b2.lp_gain) else b2
+        object.__setattr__(self, "basic_attack", basic)
 
-@dataclass
+
+@dataclass(slots=True)
 class HeroState:
     template: HeroTemplate
     hp: int
     lp: int = 0
     armor: int = 0
     alive: bool = True
-    conditions: set[str] = field(default_factory=set)
+    conditions: int = 0
     boons: List["Boon"] = field(default_factory=list)
     damage_done_this_room: float = 0.0
     reroll_free_this_round: bool = False
     first_attack_this_round: bool = True
     rune_slots: List[str] = field(default_factory=list)
-
-
-@dataclass
+    # drafted boons flattened for the attack path, maintained by add_boon():
+    # one color and catalog index per bonus die, and (idx, amount) pairs
+    boon_dice_colors: List[str] = field(default_factory=list, repr=False)
+    boon_dice_srcs: List[int] = field(default_factory=list, repr=False)
+    boon_flat_bonus: List[Tuple[int, int]] = field(default_factory=list, repr=False)
+    # (idx, color, amount, grants_lp) per special-face bonus, in boon then damage-before-LP order
+    boon_special_bonus: List[Tuple[int, str, int, bool]] = field(default_factory=list, repr=False)
+    boon_kill_lp: List[Tuple[int, int]] = field(default_factory=list, repr=False)
+
+    def add_boon(self, boon: "Boon") -> None:
+        self.boons.append(boon)
+        for c, n in boon.dice_bonus.items():
+            self.boon_dice_colors.extend([c] * n)
+            self.boon_dice_srcs.extend([boon.idx] * n)
+        for c, extra in boon.on_color_special_bonus_damage.items():
+            self.boon_special_bonus.append((boon.idx, c, extra, False))
+        for c, lp in boon.on_color_special_bonus_lp.items():
+            self.boon_special_bonus.append((boon.idx, c, lp, True))
+        if boon.on_attack_flat_bonus:
+            self.boon_flat_bonus.append((boon.idx, boon.on_attack_flat_bonus))
+        if boon.on_kill_lp:
+            self.boon_kill_lp.append((boon.idx, boon.on_kill_lp))
+
+    def reset(self) -> None:
+        """Return to a fresh-run state in place so the object can be reused."""
+        self.hp = self.template.max_hp
+        self.lp = 0
+        self.armor = 0
+        self.alive = True
+        self.conditions = 0
+        self.boons.clear()
+        self.damage_done_this_room = 0.0
+        self.reroll_free_this_round = False
+        self.first_attack_this_round = True
+        self.rune_slots.clear()
+        self.boon_dice_colors.clear()
+        self.boon_dice_srcs.clear()
+        self.boon_flat_bonus.clear()
+        self.boon_special_bonus.clear()
+        self.boon_kill_lp.clear()
+
+
+# villain effects as bits of VillainTemplate.effect_mask
+EFFECT_BITS = {name: 1 << i for i, name in enumerate(("drain_lp", "staggered", "self_toughened", "ignore_armor", "push", "terror", "splash"))}
+EFFECT_DRAIN_LP = EFFECT_BITS["drain_lp"]
+EFFECT_STAGGERED = EFFECT_BITS["staggered"]
+EFFECT_SELF_TOUGHENED = EFFECT_BITS["self_toughened"]
+EFFECT_IGNORE_ARMOR = EFFECT_BITS["ignore_armor"]
+EFFECT_TERROR = EFFECT_BITS["terror"]
+EFFECT_SPLASH = EFFECT_BITS["splash"]
+
+
+@dataclass(slots=True, frozen=True)
 class VillainTemplate:
     name: str
     hp: int
@@ -89,23 +215,61 @@ class VillainTemplate:
     target_rule: str
     vulnerability: Optional[str] = None
     effects: Tuple[str, ...] = ()
+    effect_mask: int = field(init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "effect_mask", sum(EFFECT_BITS[e] for e in self.effects))
 
 
-@dataclass
+@dataclass(slots=True)
 class Enemy:
     template: VillainTemplate
     hp: int
     armor: int
     damage: int
     level: int
-    conditions: set[str] = field(default_factory=set)
+    conditions: int = 0
 
     @property
     def alive(self) -> bool:
         return self.hp > 0
 
-
-@dataclass
+    def reset(self, template: VillainTemplate, hp: int, armor: int, damage: int, level: int) -> None:
+        """Respawn in place as a fresh enemy so pooled objects can be reused."""
+        self.template = template
+        self.hp = hp
+        self.armor = armor
+        self.damage = damage
+        self.level = level
+        self.conditions = 0
+
+
+# gate/room rule tags as small ints, resolved once per card into Gate.rule / RoomCard.rule
+RULE_IDS = {name: i for i, name in enumerate((
+    "none", "no_reroll", "enemy_armor_round1", "enemy_first", "heal_slows", "lose_lp_on_kill",
+    "shatterburst", "vengeance", "no_positive", "lp_costs_hp", "pay_special_or_fail",
+    "minus_hero_die", "armor_on_engage", "free_reroll", "flank_bonus", "follow_up_die",
+    "empower_if_surrounded", "ignore_first_negative", "special_lp_bonus", "blank",
+    "temple_exchange", "eye_omen",
+))}
+RULE_LP_COSTS_HP = RULE_IDS["lp_costs_hp"]
+RULE_PAY_SPECIAL_OR_FAIL = RULE_IDS["pay_special_or_fail"]
+RULE_MINUS_HERO_DIE = RULE_IDS["minus_hero_die"]
+RULE_NO_REROLL = RULE_IDS["no_reroll"]
+RULE_FREE_REROLL = RULE_IDS["free_reroll"]
+RULE_FLANK_BONUS = RULE_IDS["flank_bonus"]
+RULE_FOLLOW_UP_DIE = RULE_IDS["follow_up_die"]
+RULE_ENEMY_ARMOR_ROUND1 = RULE_IDS["enemy_armor_round1"]
+RULE_LOSE_LP_ON_KILL = RULE_IDS["lose_lp_on_kill"]
+RULE_SHATTERBURST = RULE_IDS["shatterburst"]
+RULE_VENGEANCE = RULE_IDS["vengeance"]
+RULE_HEAL_SLOWS = RULE_IDS["heal_slows"]
+RULE_TEMPLE_EXCHANGE = RULE_IDS["temple_exchange"]
+RULE_EMPOWER_IF_SURROUNDED = RULE_IDS["empower_if_surrounded"]
+RULE_ENEMY_FIRST = RULE_IDS["enemy_first"]
+
+
+@dataclass(slots=True, frozen=True)
 class Gate:
     name: str
     gate_type: str
@@ -114,17 +278,35 @@ class Gate:
     start_lp: int = 0
     start_heal: int = 0
     rule_tag: str = "none"
+    rule: int = field(init=False, repr=False)
+    # choose_gate()'s score for each taint bucket (<= 10, 11, >= 12)
+    scores: Tuple[float, float, float] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "rule", RULE_IDS[self.rule_tag])
+        base = 1.4 * len(self.fragments) - 1.1 * self.threat
+        if self.gate_type == "nexus":
+            scores = (base - 0.5, base - 0.5, base + 0.5)
+        elif self.gate_type == "temple":
+            scores = (base, base + 1.0, base + 1.0)
+        else:
+            scores = (base, base, base)
+        object.__setattr__(self, "scores", scores)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RoomCard:
     name: str
     room_type: str
     spawns_by_threat: Dict[int, List[Tuple[str, bool]]]
     rule_tag: str = "none"
+    rule: int = field(init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "rule", RULE_IDS[self.rule_tag])
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Boon:
     name: str
     color: str
@@ -133,6 +315,19 @@ class Boon:
     on_color_special_bonus_damage: Dict[str, int] = field(default_factory=dict)
     on_color_special_bonus_lp: Dict[str, int] = field(default_factory=dict)
     on_kill_lp: int = 0
+    # position in the boon catalog, assigned by boon_catalog(); indexes boon_cp
+    idx: int = field(default=-1, init=False, repr=False)
+    # fixed drafting value, used to pick the best of the drawn boons
+    draft_score: float = field(init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "draft_score", (
+            sum(self.dice_bonus.values()) * 3
+            + self.on_attack_flat_bonus
+            + 0.4 * sum(self.on_color_special_bonus_damage.values())
+            + 0.35 * sum(self.on_color_special_bonus_lp.values())
+            + self.on_kill_lp * 0.3
+        ))
 
 
 HEROES = [
@@ -140,14 +335,14 @@ HEROES = [
         Attack("Pillar-Breaker Blow", {"red": 3}, lp_gain=1, special_rules={"red": 1}),
         Attack("Club Spin", {"green": 2}, lp_gain=2, special_rules={"green": 1}),
         Attack("Colossus Smash", {"red": 4}, lp_cost=2, special_rules={"red": 2}),
-        Attack("True Might", {"yellow": 4, "red": 3}, lp_cost=3, full_spender=True),
+        Attack("True Might", {"yellow": 4, "red": 3}, lp_cost=3, full_spender=True, lp_scaled_color="red"),
     ]),
     HeroTemplate("Merlin", 18, "blue", [
         Attack("Arcane Volley", {"blue": 2}, lp_gain=1, range_type="ranged", special_rules={"blue": 1}),
         Attack("Spiritual Gifts", {"grey": 2}, lp_gain=2, range_type="ranged", special_rules={"grey": 1}),
         Attack("Whispers of the Wyrd", {"grey": 2}, lp_cost=2, range_type="ranged"),
         Attack("Avalon's Light", {"blue": 7}, lp_cost=3, full_spender=True),
-    ]),
+    ], rune_caster=True),
     HeroTemplate("Joan d’Arc", 20, "yellow", [
         Attack("Blade of Lys", {"yellow": 1, "red": 2}, lp_gain=1, special_rules={"yellow": 1, "red": 1}),
         Attack("Holy Bolt", {"yellow": 2}, lp_gain=2, range_type="ranged", special_rules={"yellow": 1}),
@@ -158,7 +353,7 @@ HEROES = [
         Attack("Guile Strike", {"green": 2}, lp_gain=1, special_rules={"green": 1}),
         Attack("Story-weaver", {"yellow": 2}, lp_gain=2, special_rules={"yellow": 1}),
         Attack("Snare and Sever", {"green": 3, "blue": 2}, lp_cost=2, range_type="ranged", special_rules={"green": 2}),
-        Attack("The Last Thread", {"green": 3}, lp_cost=3, full_spender=True),
+        Attack("The Last Thread", {"green": 3}, lp_cost=3, full_spender=True, lp_scaled_color="green"),
     ]),
 ]
 
@@ -172,8 +367,16 @@ VILLAINS = {
 }
 LEVEL_MODS = {1: (0, 0, 0), 2: (0, 2, 1), 3: (1, 5, 3), 4: (1, 7, 5), 5: (2, 10, 7), 6: (2, 15, 10)}
 
+# (template, hp, armor, damage) for every villain at every level, scaled once at import
+SPAWN_STATS = {
+    (name, level): (v, v.hp + hp_b, v.armor + a, v.damage + d)
+    for name, v in VILLAINS.items()
+    for level, (a, hp_b, d) in LEVEL_MODS.items()
+}
+
 
-STANDARD_GATES = [
+# gate and room catalogs are immutable tuples; each run's decks are shuffled list copies
+STANDARD_GATES = (
     Gate("Spiked Gate", "basic", 2, ["red", "red"], start_lp=1),
     Gate("Cursed Gate", "basic", 2, ["blue", "blue"], start_lp=1, rule_tag="no_reroll"),
     Gate("Reinforced Gate", "basic", 2, ["red", "yellow"], start_lp=1, rule_tag="enemy_armor_round1"),
@@ -194,15 +397,15 @@ STANDARD_GATES = [
     Gate("Temple of Clarity", "temple", 1, ["blue"], start_lp=1),
     Gate("Temple of Fire", "temple", 1, ["green"], start_lp=1),
     Gate("Temple of Purity", "temple", 1, ["yellow"], start_lp=1),
-]
-NEXUS_GATES = [
+)
+NEXUS_GATES = (
     Gate("Nexus of Denied Strength", "nexus", 3, ["blue", "grey"], start_lp=1, start_heal=1),
     Gate("Nexus of Denied Magic", "nexus", 3, ["green", "yellow"], start_lp=2),
     Gate("Nexus of Denied Speed", "nexus", 3, ["red", "blue"], start_lp=1),
     Gate("Nexus of Denied Spirit", "nexus", 3, ["yellow", "yellow"], start_heal=2),
     Gate("Nexus of Denied Faith", "nexus", 3, ["blue", "grey", "yellow"], start_lp=2, start_heal=1),
     Gate("Nexus of Denied Destiny", "nexus", 4, ["red", "red", "blue"], start_lp=3, rule_tag="minus_hero_die"),
-]
+)
 
 
 def basic_rooms() -> List[RoomCard]:
@@ -246,130 +449,163 @@ def nexus_rooms() -> List[RoomCard]:
     ]
 
 
-def boon_catalog() -> Dict[str, List[Boon]]:
-    return {
-        "red": [Boon("War God’s Might", "red", {"red": 2}), Boon("War God’s Power", "red", {"red": 2}), Boon("Mjolnir’s Spark", "red", {"red": 1}, on_color_special_bonus_damage={"red": 5}), Boon("Onslaught", "red", {}, on_color_special_bonus_damage={"red": 5})],
-        "green": [Boon("Blessing of Alacrity", "green", {"green": 2}), Boon("Wind Step", "green", {"green": 1}), Boon("Whisper of the Coffin", "green", {"green": 1}, on_attack_flat_bonus=2), Boon("Coffin Nail", "green", {}, on_color_special_bonus_damage={"green": 8})],
-        "grey": [Boon("Scriber's Insight", "grey", {"grey": 2}), Boon("Glyph's Wisdom", "grey", {"grey": 2}), Boon("Athena’s Rally", "grey", {"grey": 1}, on_color_special_bonus_lp={"grey": 1}), Boon("Ancient Secrets", "grey", {}, on_color_special_bonus_lp={"grey": 4})],
-        "blue": [Boon("Allfather's Vision", "blue", {"blue": 2}), Boon("Rune Writing", "blue", {"blue": 1}), Boon("Nile's Flow", "blue", {"blue": 1}, on_color_special_bonus_lp={"blue": 2}), Boon("Dooming Hex", "blue", {"blue": 1}, on_color_special_bonus_damage={"blue": 2})],
-        "yellow": [Boon("Fey Majesty", "yellow", {"yellow": 2}), Boon("Courtly Glamour", "yellow", {"yellow": 2}), Boon("Zeus’ Judgment", "yellow", {}, on_color_special_bonus_damage={"yellow": 7}), Boon("Fae Bargain", "yellow", {"yellow": 1}, on_color_special_bonus_lp={"yellow": 8})],
+# room catalogs are built once at import, like the gate tuples above
+BASIC_ROOMS = tuple(basic_rooms())
+TEMPLE_ROOMS = tuple(temple_rooms())
+NEXUS_ROOMS = tuple(nexus_rooms())
+
+
+@lru_cache(maxsize=1)
+def boon_catalog() -> Dict[str, Tuple[Boon, ...]]:
+    """Boon decks by color; built once and shared, so callers must not mutate it."""
+    catalog = {
+        "red": (Boon("War God’s Might", "red", {"red": 2}), Boon("War God’s Power", "red", {"red": 2}), Boon("Mjolnir’s Spark", "red", {"red": 1}, on_color_special_bonus_damage={"red": 5}), Boon("Onslaught", "red", {}, on_color_special_bonus_damage={"red": 5})),
+        "green": (Boon("Blessing of Alacrity", "green", {"green": 2}), Boon("Wind Step", "green", {"green": 1}), Boon("Whisper of the Coffin", "green", {"green": 1}, on_attack_flat_bonus=2), Boon("Coffin Nail", "green", {}, on_color_special_bonus_damage={"green": 8})),
+        "grey": (Boon("Scriber's Insight", "grey", {"grey": 2}), Boon("Glyph's Wisdom", "grey", {"grey": 2}), Boon("Athena’s Rally", "grey", {"grey": 1}, on_color_special_bonus_lp={"grey": 1}), Boon("Ancient Secrets", "grey", {}, on_color_special_bonus_lp={"grey": 4})),
+        "blue": (Boon("Allfather's Vision", "blue", {"blue": 2}), Boon("Rune Writing", "blue", {"blue": 1}), Boon("Nile's Flow", "blue", {"blue": 1}, on_color_special_bonus_lp={"blue": 2}), Boon("Dooming Hex", "blue", {"blue": 1}, on_color_special_bonus_damage={"blue": 2})),
+        "yellow": (Boon("Fey Majesty", "yellow", {"yellow": 2}), Boon("Courtly Glamour", "yellow", {"yellow": 2}), Boon("Zeus’ Judgment", "yellow", {}, on_color_special_bonus_damage={"yellow": 7}), Boon("Fae Bargain", "yellow", {"yellow": 1}, on_color_special_bonus_lp={"yellow": 8})),
     }
+    for i, b in enumerate(b for deck in catalog.values() for b in deck):
+        object.__setattr__(b, "idx", i)
+    return catalog
+
+
+BOON_NAMES = [b.name for deck in boon_catalog().values() for b in deck]
+
+
+# die faces are small ints; FACES maps them back to names for display
+FACE_DMG, FACE_SPECIAL, FACE_BLANK = 0, 1, 2
+FACES = ("dmg", "special", "blank")
+# all 3**5 = 243 five-dice outcomes; one accepted 8-bit draw picks one of them
+_FACE_COMBOS = tuple(product(range(len(FACES)), repeat=5))
+
 
+def roll_dice(n: int, rng: random.Random) -> List[int]:
+    """Roll n dice with one RNG draw per five dice instead of one per die."""
+    faces: List[int] = []
+    getrandbits = rng.getrandbits
+    while len(faces) < n:
+        v = getrandbits(8)
+        if v < len(_FACE_COMBOS):
+            faces.extend(_FACE_COMBOS[v])
+    del faces[n:]
+    return faces
 
-def roll_die() -> str:
-    r = random.random()
-    if r < 1 / 3:
-        return "dmg"
-    if r < 2 / 3:
-        return "special"
-    return "blank"
+
+def roll_die(rng: random.Random) -> int:
+    return int(rng.random() * 3)
 
 
 def clamp(v: int, lo: int, hi: int) -> int:
     return max(lo, min(hi, v))
 
 
-def init_deck(cards: List):
-    deck = cards.copy()
-    random.shuffle(deck)
+def init_deck(cards: Tuple, rng: random.Random) -> List:
+    deck = list(cards)
+    rng.shuffle(deck)
     return deck
 
 
-def draw_one(deck: List, refill: Optional[List] = None):
+def draw_one(deck: List, rng: random.Random, refill: Optional[Tuple] = None):
     if not deck and refill:
-        deck.extend(refill.copy())
-        random.shuffle(deck)
+        deck.extend(refill)
+        rng.shuffle(deck)
     return deck.pop() if deck else None
 
 
-def apply_condition(entity: HeroState | Enemy, incoming: str):
-    opp = OPPOSING.get(incoming)
-    if opp and opp in entity.conditions:
-        entity.conditions.remove(opp)
-        weaker = CONDITION_LADDERS.get(opp, [opp])[0]
-        if weaker in entity.conditions:
-            entity.conditions.remove(weaker)
-        return
-
-    if incoming in CONDITION_LADDERS:
-        weak, strong = CONDITION_LADDERS[incoming]
-        if strong in entity.conditions:
-            return
-        if weak in entity.conditions:
-            entity.conditions.remove(weak)
-            entity.conditions.add(strong)
-            return
-        entity.conditions.add(weak)
-    else:
-        entity.conditions.add(incoming)
+def apply_condition(entity: HeroState | Enemy, incoming: int):
+    opp_bit, opp_clear, weak, strong = CONDITION_RULES[incoming]
+    conds = entity.conditions
+    if conds & opp_bit:
+        entity.conditions = conds & ~opp_clear
+    elif not strong:
+        entity.conditions = conds | weak
+    elif not conds & strong:
+        entity.conditions = (conds & ~weak) | strong if conds & weak else conds | weak
 
 
 def remove_surge_conditions(heroes: List[HeroState], enemies: List[Enemy]):
     for h in heroes:
-        h.conditions = {c for c in h.conditions if c not in POSITIVE_CONDS}
+        h.conditions &= ~POSITIVE_MASK
     for e in enemies:
-        e.conditions = {c for c in e.conditions if c not in NEGATIVE_CONDS}
+        e.conditions &= ~NEGATIVE_MASK
+
+
+# pooled Enemy objects, reset for each room; a room's enemies are dead weight once it ends
+ENEMY_POOL: List[Enemy] = []
 
 
 def spawn_from_card(room: RoomCard, threat: int, spawn_level: int) -> List[Enemy]:
     entries = room.spawns_by_threat.get(threat) or room.spawns_by_threat.get(3) or room.spawns_by_threat[min(room.spawns_by_threat)]
-    enemies: List[Enemy] = []
-    for name, elite in entries:
-        lvl = min(6, spawn_level + (1 if elite else 0))
-        a, hp_b, d = LEVEL_MODS[lvl]
-        t = VILLAINS[name]
-        enemies.append(Enemy(t, t.hp + hp_b, t.armor + a, t.damage + d, lvl))
+    while len(ENEMY_POOL) < len(entries):
+        ENEMY_POOL.append(Enemy(VILLAINS[entries[0][0]], 0, 0, 0, 1))
+    enemies = ENEMY_POOL[:len(entries)]
+    for e, (name, elite) in zip(enemies, entries):
+        level = min(6, spawn_level + (1 if elite else 0))
+        e.reset(*SPAWN_STATS[name, level], level)
     return enemies
 
 
 def choose_target_enemy(enemies: List[Enemy]) -> Optional[Enemy]:
-    alive = [e for e in enemies if e.alive]
-    return min(alive, key=lambda e: (e.hp, -e.damage)) if alive else None
+    return min((e for e in enemies if e.hp > 0), key=lambda e: (e.hp, -e.damage), default=None)
+
+
+# (min/max, key) per villain target rule; anything else goes for the lowest HP
+TARGET_RULES = {
+    "low_hp": (min, attrgetter("hp")),
+    "high_hp": (max, attrgetter("hp")),
+    "high_lp": (max, attrgetter("lp")),
+}
+_DEFAULT_TARGET_RULE = TARGET_RULES["low_hp"]
 
 
 def choose_enemy_target(enemy: Enemy, heroes: List[HeroState]) -> Optional[HeroState]:
-    alive = [h for h in heroes if h.alive]
-    if not alive:
-        return None
-    if enemy.template.target_rule == "low_hp":
-        return min(alive, key=lambda h: h.hp)
-    if enemy.template.target_rule == "high_hp":
-        return max(alive, key=lambda h: h.hp)
-    if enemy.template.target_rule == "high_lp":
-        return max(alive, key=lambda h: h.lp)
-    return min(alive, key=lambda h: h.hp)
+    pick, key = TARGET_RULES.get(enemy.template.target_rule, _DEFAULT_TARGET_RULE)
+    return pick((h for h in heroes if h.alive), key=key, default=None)
 
 
 def pick_attack(hero: HeroState, enemies: List[Enemy]) -> Attack:
     if hero.lp >= 6:
         return hero.template.attacks[3]
-    if hero.lp >= hero.template.attacks[2].lp_cost and any(e.hp >= 10 for e in enemies if e.alive):
+    # Enemy.alive is hp > 0, so the hp check alone skips the dead
+    if hero.lp >= hero.template.attacks[2].lp_cost and any(e.hp >= 10 for e in enemies):
         return hero.template.attacks[2]
-    b1, b2 = hero.template.attacks[0], hero.template.attacks[1]
-    return b1 if (sum(b1.base_dice.values()) + 0.6 * b1.lp_gain) >= (sum(b2.base_dice.values()) + 0.6 * b2.lp_gain) else b2
+    return hero.template.basic_attack
 
 
-def try_reroll(face: str, hero: HeroState, gate: Gate, room: RoomCard) -> str:
-    if face != "blank":
-        return face
-    if gate.rule_tag == "no_reroll":
-        return face
-    free = room.rule_tag == "free_reroll" and not hero.reroll_free_this_round
-    if free and random.random() < 0.8:
+def take_reroll(hero: HeroState, free_reroll_room: bool, rng: random.Random) -> bool:
+    """Decide whether a blank is rerolled, paying the free reroll or 1 LP for it."""
+    free = free_reroll_room and not hero.reroll_free_this_round
+    if free and rng.random() < 0.8:
         hero.reroll_free_this_round = True
-        return roll_die()
-    if hero.lp > 0 and random.random() < 0.35:
+        return True
+    if hero.lp > 0 and rng.random() < 0.35:
         hero.lp -= 1
-        return roll_die()
-    return face
+        return True
+    return False
+
+
+@lru_cache(maxsize=1024)
+def base_pool_colors(atk: Attack, relic_color: str, lp_spent: int, minus_die: bool) -> Tuple[str, ...]:
+    """Die colors an attack rolls before boons and seals, relic die last."""
+    pool_colors: List[str] = []
+    for c, n in atk.dice_pairs:
+        if c == atk.lp_scaled_color:
+            n += max(0, lp_spent - 3)
+        if minus_die:
+            n = max(1, n - 1)
+        pool_colors.extend([c] * n)
+    pool_colors.append(relic_color)
+    return tuple(pool_colors)
 
 
-def resolve_hero_attack(hero: HeroState, enemies: List[Enemy], seals: List[str], boon_cp: Dict[str, float], gate: Gate, room: RoomCard, round_no: int):
+def resolve_hero_attack(hero: HeroState, enemies: List[Enemy], seals: List[str], boon_cp: List[float], gate: Gate, room: RoomCard, round_no: int, rng: random.Random) -> bool:
+    """Resolve one hero action; returns True if it killed its target."""
     if not hero.alive:
-        return
-    if "staggered" in hero.conditions:
-        hero.conditions.remove("staggered")
-        return
+        return False
+    if hero.conditions & COND_STAGGERED:
+        hero.conditions &= ~COND_STAGGERED
+        return False
 
     atk = pick_attack(hero, enemies)
     if hero.lp < atk.lp_cost:
@@ -377,87 +613,79 @@ def resolve_hero_attack(hero: HeroState, enemies: List[Enemy], seals: List[str],
 
     lp_spent = max(3, hero.lp) if atk.full_spender else atk.lp_cost
     hero.lp = clamp(hero.lp - lp_spent, 0, 12)
-    if gate.rule_tag == "lp_costs_hp" and lp_spent > 0:
+    if gate.rule == RULE_LP_COSTS_HP and lp_spent > 0:
         hero.hp -= max(0, lp_spent - (1 if hero.first_attack_this_round else 0))
 
-    if gate.rule_tag == "pay_special_or_fail" and random.random() < 0.3:
-        return
+    if gate.rule == RULE_PAY_SPECIAL_OR_FAIL and rng.random() < 0.3:
+        return False
 
-    pool: List[Tuple[str, Optional[str]]] = []
-    for c, n in atk.base_dice.items():
-        if atk.full_spender and c == "red" and hero.template.name == "Hercules":
-            n += max(0, lp_spent - 3)
-        if atk.full_spender and c == "green" and hero.template.name == "Anansi":
-            n = lp_spent
-        if gate.rule_tag == "minus_hero_die":
-            n = max(1, n - 1)
-        for _ in range(n):
-            pool.append((c, None))
-    pool.append((hero.template.relic_die_color, None))
+    # dice pool as parallel arrays: a color per die, plus the boon name behind
+    # each die in the [boon_start, boon_end) slice of the pool
+    pool_colors = list(base_pool_colors(atk, hero.template.relic_die_color, lp_spent, gate.rule == RULE_MINUS_HERO_DIE))
 
-    for b in hero.boons:
-        for c, n in b.dice_bonus.items():
-            for _ in range(n):
-                pool.append((c, b.name))
+    boon_start = len(pool_colors)
+    pool_colors += hero.boon_dice_colors
+    boon_srcs = hero.boon_dice_srcs
+    boon_end = len(pool_colors)
 
-    # seal channeling
+    # seal channeling: max() keeps Counter.most_common's first-banked tie order
     if len(seals) >= 2:
-        c = Counter(seals).most_common(1)[0][0]
-        if seals.count(c) >= 2 and random.random() < 0.2:
+        c = max(seals, key=seals.count)
+        if seals.count(c) >= 2 and rng.random() < 0.2:
             seals.remove(c); seals.remove(c)
-            pool.append((c, "sealed_channel"))
-
-    rolled: List[Tuple[str, str, Optional[str]]] = []
-    for c, src in pool:
-        face = try_reroll(roll_die(), hero, gate, room)
-        rolled.append((c, face, src))
-
-    specials = Counter()
-    dmg = 0
-    for c, face, src in rolled:
-        if face == "dmg":
-            dmg += 1
-            if src and src not in ("sealed_channel",):
-                boon_cp[src] += CP_DAMAGE
-        elif face == "special":
-            specials[c] += 1
-
-    # bank 1 seal (or Merlin rune slot)
-    if sum(specials.values()) > 0 and len(seals) < 6 and random.random() < 0.45:
+            pool_colors.append(c)
+
+    # gate/room reroll rules are fixed for the whole pool
+    can_reroll = gate.rule != RULE_NO_REROLL
+    free_reroll_room = room.rule == RULE_FREE_REROLL
+    faces = roll_dice(len(pool_colors), rng)
+    if can_reroll:
+        # decide every reroll first, then draw all replacement faces in one batch
+        rerolled = [i for i, face in enumerate(faces) if face == FACE_BLANK and take_reroll(hero, free_reroll_room, rng)]
+        for i, face in zip(rerolled, roll_dice(len(rerolled), rng)):
+            faces[i] = face
+
+    dmg = faces.count(FACE_DMG)
+    specials = Counter([c for c, face in zip(pool_colors, faces) if face == FACE_SPECIAL])
+    for src, face in zip(boon_srcs, faces[boon_start:boon_end]):
+        if face == FACE_DMG:
+            boon_cp[src] += CP_DAMAGE
+
+    # bank 1 seal (or Merlin rune slot); every count is positive at this point
+    if specials and len(seals) < 6 and rng.random() < 0.45:
         k = specials.most_common(1)[0][0]
         specials[k] -= 1
         if specials[k] <= 0:
             del specials[k]
-        if hero.template.name == "Merlin" and len(hero.rune_slots) < 3 and random.random() < 0.5:
+        if hero.template.rune_caster and len(hero.rune_slots) < 3 and rng.random() < 0.5:
             hero.rune_slots.append(k)
-            if len(hero.rune_slots) == 3 and random.random() < 0.5:
+            if len(hero.rune_slots) == 3 and rng.random() < 0.5:
                 # completed spell: distribute LP
-                for ally in random.sample([h for h in HERO_STATES if h.alive], k=min(4, len([h for h in HERO_STATES if h.alive]))):
+                alive_allies = [h for h in HERO_STATES if h.alive]
+                for ally in rng.sample(alive_allies, k=min(4, len(alive_allies))):
                     ally.lp = clamp(ally.lp + 1, 0, 12)
                 seals.extend(hero.rune_slots)
                 hero.rune_slots.clear()
         else:
             seals.append(k)
 
-    for c, req in atk.special_rules.items():
+    for c, req in atk.special_pairs:
         if specials.get(c, 0) >= req:
             specials[c] -= req
             dmg += 2
 
-    for b in hero.boons:
-        for c, extra in b.on_color_special_bonus_damage.items():
-            if specials.get(c, 0) >= 1:
-                specials[c] -= 1
-                dmg += extra
-                boon_cp[b.name] += extra * CP_DAMAGE
-        for c, lp in b.on_color_special_bonus_lp.items():
-            if specials.get(c, 0) >= 1:
-                specials[c] -= 1
-                hero.lp = clamp(hero.lp + lp, 0, 12)
-                boon_cp[b.name] += lp * CP_LP
-        if b.on_attack_flat_bonus:
-            dmg += b.on_attack_flat_bonus
-            boon_cp[b.name] += b.on_attack_flat_bonus * CP_DAMAGE
+    for src, c, amount, grants_lp in hero.boon_special_bonus:
+        if specials.get(c, 0) >= 1:
+            specials[c] -= 1
+            if grants_lp:
+                hero.lp = clamp(hero.lp + amount, 0, 12)
+                boon_cp[src] += amount * CP_LP
+            else:
+                dmg += amount
+                boon_cp[src] += amount * CP_DAMAGE
+    for src, bonus in hero.boon_flat_bonus:
+        dmg += bonus
+        boon_cp[src] += bonus * CP_DAMAGE
 
     for _, n in specials.items():
         for _ in range(n):
@@ -466,86 +694,74 @@ def resolve_hero_attack(hero: HeroState, enemies: List[Enemy], seals: List[str],
             else:
                 dmg += 2
 
-    if "empowered" in hero.conditions:
-        dmg += 1
-    if "exalted" in hero.conditions:
-        dmg += 3
-    if "weakened" in hero.conditions:
-        dmg -= 1
-    if "enfeebled" in hero.conditions:
-        dmg -= 3
-    if room.rule_tag == "flank_bonus" and random.random() < 0.35:
+    dmg += HERO_DMG_COND_DELTA[hero.conditions & HERO_DMG_COND_MASK]
+    if room.rule == RULE_FLANK_BONUS and rng.random() < 0.35:
         dmg += 1
-    if room.rule_tag == "follow_up_die" and not hero.first_attack_this_round and random.random() < 0.5:
-        dmg += 1 if roll_die() == "dmg" else 0
-    if gate.rule_tag == "enemy_armor_round1" and round_no == 1:
+    if room.rule == RULE_FOLLOW_UP_DIE and not hero.first_attack_this_round and rng.random() < 0.5:
+        dmg += 1 if roll_die(rng) == FACE_DMG else 0
+    if gate.rule == RULE_ENEMY_ARMOR_ROUND1 and round_no == 1:
         dmg = max(0, dmg - 1)
 
     hero.lp = clamp(hero.lp + atk.lp_gain, 0, 12)
     target = choose_target_enemy(enemies)
     if not target:
-        return
+        return False
 
-    dtype = max(atk.base_dice.items(), key=lambda kv: kv[1])[0] if atk.base_dice else "red"
-    if target.template.vulnerability == dtype:
+    if target.template.vulnerability == atk.damage_type:
         dmg *= 2
     dealt = max(0, dmg - target.armor)
     target.hp -= dealt
     hero.damage_done_this_room += dealt
 
-    if target.hp <= 0:
-        for b in hero.boons:
-            if b.on_kill_lp:
-                hero.lp = clamp(hero.lp + b.on_kill_lp, 0, 12)
-                boon_cp[b.name] += b.on_kill_lp * CP_LP
-        if gate.rule_tag == "lose_lp_on_kill":
+    killed = target.hp <= 0
+    if killed:
+        for src, lp in hero.boon_kill_lp:
+            hero.lp = clamp(hero.lp + lp, 0, 12)
+            boon_cp[src] += lp * CP_LP
+        if gate.rule == RULE_LOSE_LP_ON_KILL:
             hero.lp = max(0, hero.lp - 1)
-        if gate.rule_tag == "shatterburst":
+        if gate.rule == RULE_SHATTERBURST:
             hero.hp -= 1
-        if gate.rule_tag == "vengeance":
+        if gate.rule == RULE_VENGEANCE:
             for e in enemies:
                 if e.alive:
-                    apply_condition(e, "empowered")
+                    apply_condition(e, COND_EMPOWERED)
 
     hero.first_attack_this_round = False
+    return killed
 
 
-def resolve_enemy_attack(enemy: Enemy, heroes: List[HeroState], taint: List[int], round_no: int):
+def resolve_enemy_attack(enemy: Enemy, heroes: List[HeroState], taint: List[int], round_no: int, rng: random.Random) -> bool:
+    """Resolve one enemy action; returns True if it killed its target."""
     target = choose_enemy_target(enemy, heroes)
     if not target:
-        return
-    dmg = enemy.damage
-    if "weakened" in enemy.conditions:
-        dmg = max(0, dmg - 1)
-    if "enfeebled" in enemy.conditions:
-        dmg = max(0, dmg - 3)
-    if "empowered" in enemy.conditions:
-        dmg += 1
-    if "exalted" in enemy.conditions:
-        dmg += 3
-
-    if "exposed" in target.conditions:
-        dmg += 1
-    if "breached" in target.conditions:
-        dmg += 3
-
-    if "ignore_armor" not in enemy.template.effects:
+        return False
+    conds = enemy.conditions
+    dmg = (
+        max(0, enemy.damage - ENEMY_DMG_PENALTY[conds & ENEMY_DMG_PENALTY_MASK])
+        + ENEMY_DMG_BONUS[conds & ENEMY_DMG_BONUS_MASK]
+        + TARGET_DMG_BONUS[target.conditions & TARGET_DMG_BONUS_MASK]
+    )
+
+    effects = enemy.template.effect_mask
+    if not effects & EFFECT_IGNORE_ARMOR:
         prevented = min(target.armor, dmg)
         dmg -= prevented
         if prevented > 0:
             target.armor = max(0, target.armor - 1)
 
     target.hp -= dmg
-    if "drain_lp" in enemy.template.effects:
+    if effects & EFFECT_DRAIN_LP:
         target.lp = max(0, target.lp - 1)
-    if "staggered" in enemy.template.effects:
-        apply_condition(target, "staggered")
-    if "self_toughened" in enemy.template.effects:
+    if effects & EFFECT_STAGGERED:
+        apply_condition(target, COND_STAGGERED)
+    if effects & EFFECT_SELF_TOUGHENED:
         enemy.armor += 1
-    if "splash" in enemy.template.effects:
-        for other in random.sample([h for h in heroes if h.alive and h is not target], k=min(1, len([h for h in heroes if h.alive and h is not target]))):
-            other.hp -= 1
-    if "terror" in enemy.template.effects and random.random() < 0.4:
+    if effects & EFFECT_SPLASH:
+        others = [h for h in heroes if h.alive and h is not target]
+        if others:
+            rng.choice(others).hp -= 1
+    if effects & EFFECT_TERROR and rng.random() < 0.4:
         for h in heroes:
             if h.alive:
                 h.lp = max(0, h.lp - 1)
@@ -553,13 +769,15 @@ def resolve_enemy_attack(enemy: Enemy, heroes: List[HeroState], taint: List[int]
     if target.hp <= 0 and target.alive:
         target.alive = False
         taint[0] += 1
+        return True
+    return False
 
 
-def attempt_fragment_claim(hero: HeroState, fragments_left: List[str], seals: List[str], taint: List[int], decks: Dict[str, List[Boon]]):
+def attempt_fragment_claim(hero: HeroState, fragments_left: List[str], seals: List[str], taint: List[int], decks: Dict[str, Tuple[Boon, ...]], rng: random.Random):
     if not hero.alive or not fragments_left:
         return
     chance = 0.28 + (0.08 if hero.lp >= 4 else 0)
-    if random.random() > chance:
+    if rng.random() > chance:
         return
     color = fragments_left.pop(0)
 
@@ -569,64 +787,62 @@ def attempt_fragment_claim(hero: HeroState, fragments_left: List[str], seals: Li
         taint[0] += 1
 
     draw_n = 3
-    if hero.lp >= 1 and random.random() < 0.25:
+    if hero.lp >= 1 and rng.random() < 0.25:
         pay = min(3, hero.lp)
         hero.lp -= pay
         draw_n += pay
 
-    picks = random.sample(decks[color], k=min(draw_n, len(decks[color])))
-    pick = max(picks, key=lambda b: sum(b.dice_bonus.values()) * 3 + b.on_attack_flat_bonus + 0.4 * sum(b.on_color_special_bonus_damage.values()) + 0.35 * sum(b.on_color_special_bonus_lp.values()) + b.on_kill_lp * 0.3)
-    hero.boons.append(pick)
+    picks = rng.sample(decks[color], k=min(draw_n, len(decks[color])))
+    pick = max(picks, key=attrgetter("draft_score"))
+    hero.add_boon(pick)
 
 
-def choose_gate(taint: int, std_deck: List[Gate], nexus_deck: List[Gate]) -> Gate:
-    std1 = draw_one(std_deck, STANDARD_GATES)
-    std2 = draw_one(std_deck, STANDARD_GATES)
-    nx = draw_one(nexus_deck, NEXUS_GATES)
+def choose_gate(taint: int, std_deck: List[Gate], nexus_deck: List[Gate], rng: random.Random) -> Gate:
+    std1 = draw_one(std_deck, rng, STANDARD_GATES)
+    std2 = draw_one(std_deck, rng, STANDARD_GATES)
+    nx = draw_one(nexus_deck, rng, NEXUS_GATES)
     options = [x for x in [std1, std2, nx] if x is not None]
-    best = options[0]
-    best_score = -1e9
-    for g in options:
-        score = 1.4 * len(g.fragments) - 1.1 * g.threat
-        if g.gate_type == "nexus":
-            score += 0.5 if taint > 11 else -0.5
-        if g.gate_type == "temple" and taint > 10:
-            score += 1.0
-        if score > best_score:
-            best_score = score
-            best = g
-    return best
-
-
-def apply_room_start(heroes: List[HeroState], gate: Gate, room: RoomCard, taint: List[int]):
+    bucket = 0 if taint <= 10 else 1 if taint == 11 else 2
+    return max(options, key=lambda g: g.scores[bucket])
+
+
+def apply_room_start(heroes: List[HeroState], gate: Gate, room: RoomCard, taint: List[int], rng: random.Random):
     for h in heroes:
         if not h.alive:
             continue
         h.lp = clamp(h.lp + gate.start_lp, 0, 12)
         if gate.start_heal:
             h.hp = min(h.template.max_hp, h.hp + gate.start_heal)
-            if gate.rule_tag == "heal_slows":
-                apply_condition(h, "slowed")
-        if room.rule_tag == "temple_exchange" and random.random() < 0.25:
+            if gate.rule == RULE_HEAL_SLOWS:
+                apply_condition(h, COND_SLOWED)
+        if room.rule == RULE_TEMPLE_EXCHANGE and rng.random() < 0.25:
             taint[0] = max(0, taint[0] - 1)
 
 
-def run_single(max_rounds_safety: int = 16) -> Dict:
-    global HERO_STATES
-    heroes = [HeroState(h, h.max_hp) for h in HEROES]
-    HERO_STATES = heroes
+# one pooled HeroState per template, reset at the start of every run
+HERO_STATES = [HeroState(h, h.max_hp) for h in HEROES]
+
+
+def run_single(rng: random.Random, max_rounds_safety: int = 16) -> Dict:
+    heroes = HERO_STATES
+    for h in heroes:
+        h.reset()
+    n_heroes = len(heroes)
     decks = boon_catalog()
-    std_gate_deck = init_deck(STANDARD_GATES)
-    nexus_gate_deck = init_deck(NEXUS_GATES)
-    basic_room_deck = init_deck(basic_rooms())
-    temple_room_deck = init_deck(temple_rooms())
-    nexus_room_deck = init_deck(nexus_rooms())
+    std_gate_deck = init_deck(STANDARD_GATES, rng)
+    nexus_gate_deck = init_deck(NEXUS_GATES, rng)
+    basic_room_deck = init_deck(BASIC_ROOMS, rng)
+    temple_room_deck = init_deck(TEMPLE_ROOMS, rng)
+    nexus_room_deck = init_deck(NEXUS_ROOMS, rng)
 
     seals: List[str] = []
     taint = [0]
     spawn_level = 1
-    room_hp, room_damage, room_taint = [], [], []
-    boon_cp = defaultdict(float)
+    # fixed (room, hero) tables; rooms never reached after a wipe keep zero rows
+    room_hp: List[Tuple[int, ...]] = [(0,) * n_heroes] * MAX_ROOMS
+    room_damage: List[Tuple[float, ...]] = [(0.0,) * n_heroes] * MAX_ROOMS
+    room_taint = [0] * MAX_ROOMS
+    boon_cp = [0.0] * len(BOON_NAMES)
 
     for room_idx in range(1, MAX_ROOMS + 1):
         for h in heroes:
@@ -636,7 +852,7 @@ def run_single(max_rounds_safety: int = 16) -> Dict:
                 h.first_attack_this_round = True
             h.damage_done_this_room = 0.0
 
-        gate = choose_gate(taint[0], std_gate_deck, nexus_gate_deck)
+        gate = choose_gate(taint[0], std_gate_deck, nexus_gate_deck, rng)
 
         if any(f in seals for f in gate.fragments):
             for f in gate.fragments:
@@ -646,52 +862,63 @@ def run_single(max_rounds_safety: int = 16) -> Dict:
                     break
 
         if gate.gate_type == "temple":
-            room = draw_one(temple_room_deck, temple_rooms())
+            room = draw_one(temple_room_deck, rng, TEMPLE_ROOMS)
         elif gate.gate_type == "nexus":
-            room = draw_one(nexus_room_deck, nexus_rooms())
+            room = draw_one(nexus_room_deck, rng, NEXUS_ROOMS)
         else:
-            room = draw_one(basic_room_deck, basic_rooms())
+            room = draw_one(basic_room_deck, rng, BASIC_ROOMS)
 
-        apply_room_start(heroes, gate, room, taint)
+        apply_room_start(heroes, gate, room, taint, rng)
 
         enemies = spawn_from_card(room, gate.threat, spawn_level)
         fragments = gate.fragments.copy()
         collapse_pending = False
         round_no = 0
-
-        while any(e.alive for e in enemies) and any(h.alive for h in heroes) and round_no < max_rounds_safety:
+        # enemies only die to hero attacks, so count kills instead of rescanning
+        enemies_left = len(enemies)
+        # likewise heroes only fall to enemy attacks, bleeding or the collapse
+        heroes_left = sum(h.alive for h in heroes)
+        # room/gate rules are fixed for every round of this room
+        empower_if_surrounded = room.rule == RULE_EMPOWER_IF_SURROUNDED
+        enemy_first = gate.rule == RULE_ENEMY_FIRST
+
+        while enemies_left and heroes_left and round_no < max_rounds_safety:
             round_no += 1
             for h in heroes:
                 h.reroll_free_this_round = False
                 h.first_attack_this_round = True
-                if room.rule_tag == "empower_if_surrounded" and random.random() < 0.35:
-                    apply_condition(h, "empowered")
+                if empower_if_surrounded and rng.random() < 0.35:
+                    apply_condition(h, COND_EMPOWERED)
 
-            initiative = [h.template.name for h in heroes if h.alive] + [f"E{i}" for i, e in enumerate(enemies) if e.alive]
-            random.shuffle(initiative)
-            if gate.rule_tag == "enemy_first":
-                initiative.sort(key=lambda t: 0 if t.startswith("E") else 1)
+            # int tokens: heroes are 0..n_heroes-1, enemy j is n_heroes + j
+            initiative = [i for i, h in enumerate(heroes) if h.alive] + [n_heroes + j for j, e in enumerate(enemies) if e.alive]
+            rng.shuffle(initiative)
+            if enemy_first:
+                # stable partition: enemies first, each side keeps its shuffled order
+                initiative = [t for t in initiative if t >= n_heroes] + [t for t in initiative if t < n_heroes]
 
             for token in initiative:
-                if token.startswith("E"):
-                    enemy = enemies[int(token[1:])]
-                    if enemy.alive:
-                        resolve_enemy_attack(enemy, heroes, taint, round_no)
+                if token >= n_heroes:
+                    enemy = enemies[token - n_heroes]
+                    if enemy.alive and resolve_enemy_attack(enemy, heroes, taint, round_no, rng):
+                        heroes_left -= 1
                 else:
-                    hero = next(h for h in heroes if h.template.name == token)
+                    hero = heroes[token]
                     if not hero.alive:
                         continue
                     hero.armor = 0
-                    if "slowed" in hero.conditions and random.random() < 0.25:
-                        hero.conditions.remove("slowed")
-                    resolve_hero_attack(hero, enemies, seals, boon_cp, gate, room, round_no)
-                    attempt_fragment_claim(hero, fragments, seals, taint, decks)
-                    if "bleeding" in hero.conditions:
+                    if hero.conditions & COND_SLOWED and rng.random() < 0.25:
+                        hero.conditions &= ~COND_SLOWED
+                    if resolve_hero_attack(hero, enemies, seals, boon_cp, gate, room, round_no, rng):
+                        enemies_left -= 1
+                    attempt_fragment_claim(hero, fragments, seals, taint, decks, rng)
+                    if hero.conditions & COND_BLEEDING:
                         hero.hp -= 1
-                    if "hemorrhaging" in hero.conditions:
+                    if hero.conditions & COND_HEMORRHAGING:
                         hero.hp -= 3
                     if hero.hp <= 0 and hero.alive:
                         hero.alive = False
+                        heroes_left -= 1
                         taint[0] += 1
 
             taint[0] += 1
@@ -710,83 +937,151 @@ def run_single(max_rounds_safety: int = 16) -> Dict:
                 for h in heroes:
                     h.alive = False
                     h.hp = 0
+                heroes_left = 0
                 break
 
-        if not any(e.alive for e in enemies):
-            for h in heroes:
-                if not h.alive:
-                    h.alive = True
-                    h.hp = h.template.max_hp // 2
-                    h.lp = 0
-                    h.conditions.clear()
-
-        room_hp.append({h.template.name: max(0, h.hp) for h in heroes})
-        room_damage.append({h.template.name: h.damage_done_this_room for h in heroes})
-        room_taint.append(taint[0])
-
-        if not any(h.alive for h in heroes):
-            for _ in range(room_idx + 1, MAX_ROOMS + 1):
-                room_hp.append({h.template.name: 0 for h in heroes})
-                room_damage.append({h.template.name: 0.0 for h in heroes})
-                room_taint.append(taint[0])
+        # single sweep: revive after a cleared room, then record the room rows
+        cleared = not enemies_left
+        hp_row: List[int] = []
+        dmg_row: List[float] = []
+        for h in heroes:
+            if cleared and not h.alive:
+                h.alive = True
+                h.hp = h.template.max_hp // 2
+                h.lp = 0
+                h.conditions = 0
+                heroes_left += 1
+            hp_row.append(max(0, h.hp))
+            dmg_row.append(h.damage_done_this_room)
+        room_hp[room_idx - 1] = tuple(hp_row)
+        room_damage[room_idx - 1] = tuple(dmg_row)
+        room_taint[room_idx - 1] = taint[0]
+
+        if not heroes_left:
+            room_taint[room_idx:] = [taint[0]] * (MAX_ROOMS - room_idx)
             break
 
     return {
         "room_hp": room_hp,
         "room_damage": room_damage,
         "room_taint": room_taint,
-        "boon_cp": dict(boon_cp),
-        "survived_7": int(any(h.alive for h in heroes) and len(room_hp) >= 7),
-    }
-
-
-def aggregate(results: List[Dict]) -> Dict:
-    names = [h.name for h in HEROES]
-    avg_hp, avg_dmg, avg_taint = [], [], []
-    for i in range(MAX_ROOMS):
-        avg_hp.append({n: statistics.fmean(r["room_hp"][i][n] for r in results) for n in names})
-        avg_dmg.append({n: statistics.fmean(r["room_damage"][i][n] for r in results) for n in names})
-        avg_taint.append(statistics.fmean(r["room_taint"][i] for r in results))
-
-    boon_totals = defaultdict(float)
-    for r in results:
-        for k, v in r["boon_cp"].items():
-            boon_totals[k] += v
-    boon_avg = {k: v / len(results) for k, v in sorted(boon_totals.items(), key=lambda kv: kv[1], reverse=True)}
-
-    return {
-        "avg_hp": avg_hp,
-        "avg_dmg": avg_dmg,
-        "avg_taint": avg_taint,
-        "boon_cp_avg": boon_avg,
-        "survival_rate": statistics.fmean(r["survived_7"] for r in results),
+        # (catalog index, cp) for the boons that contributed this run
+        "boon_cp": [(i, cp) for i, cp in enumerate(boon_cp) if cp],
+        "survived_7": heroes_left > 0,
     }
 
 
-def run_simulations(n: int = DEFAULT_SIMS, seed: int = 42, max_rounds_safety: int = 16) -> Dict:
-    random.seed(seed)
-    results = [run_single(max_rounds_safety=max_rounds_safety) for _ in range(n)]
-    return aggregate(results)
+class Aggregator:
+    """Running (room, hero) sums of run results; batches merge in run order."""
+
+    __slots__ = ("n", "hp", "dmg", "taint", "boon_cp", "survived")
+
+    def __init__(self):
+        n_heroes = len(HEROES)
+        self.n = 0
+        self.hp = [[0.0] * n_heroes for _ in range(MAX_ROOMS)]
+        self.dmg = [[0.0] * n_heroes for _ in range(MAX_ROOMS)]
+        self.taint = [0.0] * MAX_ROOMS
+        self.boon_cp = [0.0] * len(BOON_NAMES)
+        self.survived = 0
+
+    def add(self, r: Dict):
+        hp, dmg, taint = self.hp, self.dmg, self.taint
+        for i, (room_hp, room_dmg, room_taint) in enumerate(zip(r["room_hp"], r["room_damage"], r["room_taint"])):
+            hp[i] = [t + v for t, v in zip(hp[i], room_hp)]
+            dmg[i] = [t + v for t, v in zip(dmg[i], room_dmg)]
+            taint[i] += room_taint
+        boon_cp = self.boon_cp
+        for i, cp in r["boon_cp"]:
+            boon_cp[i] += cp
+        self.survived += r["survived_7"]
+        self.n += 1
+
+    def merge(self, other: "Aggregator"):
+        for i in range(MAX_ROOMS):
+            self.hp[i] = [t + v for t, v in zip(self.hp[i], other.hp[i])]
+            self.dmg[i] = [t + v for t, v in zip(self.dmg[i], other.dmg[i])]
+            self.taint[i] += other.taint[i]
+        self.boon_cp = [t + v for t, v in zip(self.boon_cp, other.boon_cp)]
+        self.survived += other.survived
+        self.n += other.n
+
+    def finalize(self) -> Dict:
+        names = [h.name for h in HEROES]
+        n_runs = self.n
+        return {
+            "avg_hp": [dict(zip(names, (v / n_runs for v in row))) for row in self.hp],
+            "avg_dmg": [dict(zip(names, (v / n_runs for v in row))) for row in self.dmg],
+            "avg_taint": [v / n_runs for v in self.taint],
+            # boons that never contributed are left out of the report
+            "boon_cp_avg": {name: v / n_runs for name, v in zip(BOON_NAMES, self.boon_cp) if v},
+            "survival_rate": self.survived / n_runs,
+        }
+
+
+def _init_worker():
+    gc.disable()
+
+
+def run_batch(batch: Tuple[List[int], int]) -> Aggregator:
+    """Pool entry point: play a batch of runs, each on its own seeded RNG, into one partial aggregate."""
+    seeds, max_rounds_safety = batch
+    agg = Aggregator()
+    for run_seed in seeds:
+        agg.add(run_single(random.Random(run_seed), max_rounds_safety=max_rounds_safety))
+    return agg
+
+
+def run_simulations(n: int = DEFAULT_SIMS, seed: int = 42, max_rounds_safety: int = 16, workers: int = 1) -> Dict:
+    # per-run seeds make the report independent of the worker count
+    master = random.Random(seed)
+    seeds = [master.getrandbits(64) for _ in range(n)]
+    if workers > 1:
+        # one pool task per batch of runs amortizes task dispatch and pickling
+        batch_size = max(1, n // (workers * 8))
+        batches = [(seeds[i:i + batch_size], max_rounds_safety) for i in range(0, n, batch_size)]
+        agg = Aggregator()
+        with multiprocessing.Pool(workers, initializer=_init_worker) as pool:
+            # ordered imap keeps the boon report stable for equal CP values
+            for part in pool.imap(run_batch, batches):
+                agg.merge(part)
+        return agg.finalize()
+
+    # runs allocate no reference cycles; keep the cyclic GC out of the hot loop
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        agg = run_batch((seeds, max_rounds_safety))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return agg.finalize()
 
 
 def print_report(agg: Dict, sims: int):
-    print(f"Spellrift balance simulation report ({sims} runs)")
-    print("=" * 72)
+    # build the whole report and emit it in one write
+    out: List[str] = []
+    append = out.append
+    append(f"Spellrift balance simulation report ({sims} runs)")
+    append("=" * 72)
+    hero_prefix = {h.name: f"    - {h.name:12s}: " for h in HEROES}
     for i in range(MAX_ROOMS):
-        print(f"\nRoom {i+1}")
-        print(f"  Avg Taint: {agg['avg_taint'][i]:.2f}")
-        print("  Avg Hero HP at room end:")
+        append(f"\nRoom {i+1}")
+        append(f"  Avg Taint: {agg['avg_taint'][i]:.2f}")
+        append("  Avg Hero HP at room end:")
         for hn, v in agg["avg_hp"][i].items():
-            print(f"    - {hn:12s}: {v:6.2f}")
-        print("  Avg damage dealt by hero in this room:")
+            append(f"{hero_prefix[hn]}{v:6.2f}")
+        append("  Avg damage dealt by hero in this room:")
         for hn, v in agg["avg_dmg"][i].items():
-            print(f"    - {hn:12s}: {v:6.2f}")
+            append(f"{hero_prefix[hn]}{v:6.2f}")
 
-    print(f"\nEstimated run survival to room 7: {agg['survival_rate']*100:.2f}%")
-    print("\nTop 40 Boon cards by average CP contribution per run")
-    print("-" * 72)
-    for i, (name, cp) in enumerate(list(agg["boon_cp_avg"].items())[:40], start=1):
-        print(f"{i:2d}. {name:32s} {cp:8.3f} CP/run")
+    append(f"\nEstimated run survival to room 7: {agg['survival_rate']*100:.2f}%")
+    append("\nTop 40 Boon cards by average CP contribution per run")
+    append("-" * 72)
+    # nlargest matches a stable descending sort, so ties keep catalog order
+    for i, (name, cp) in enumerate(heapq.nlargest(40, agg["boon_cp_avg"].items(), key=itemgetter(1)), start=1):
+        append(f"{i:2d}. {name:32s} {cp:8.3f} CP/run")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
@@ -796,7 +1091,8 @@ if __name__ == "__main__":
     parser.add_argument("--sims", type=int, default=DEFAULT_SIMS)
     parser.add_argument("--seed", type=int, default=42)
     parser.add_argument("--max-rounds-safety", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
     args = parser.parse_args()
 
-    aggregated = run_simulations(args.sims, args.seed, args.max_rounds_safety)
+    aggregated = run_simulations(args.sims, args.seed, args.max_rounds_safety, args.workers)
     print_report(aggregated, args.sims)